@@ -1,8 +1,26 @@
-import pickle
 import pandas as pd
 
-df = pd.read_csv('electroless_plating_365day_dataset.csv')
-data_dict = df.to_dict(orient='records')
+# explicit dtypes skip type inference; low-cardinality text is stored as category
+dtypes = {
+    'Date': 'str',
+    'Shift': 'category',
+    'Batch ID': 'str',
+    'Plating Type': 'category',
+    'Component Type': 'category',
+    'Machine ID': 'category',
+    'Bath Temperature (°C)': 'float64',
+    'pH Level': 'float64',
+    'Plating Time (min)': 'float64',
+    'Thickness (μm)': 'float64',
+    'Adhesion Strength (MPa)': 'float64',
+    'Phosphorus Content (%)': 'float64',
+    'Surface Roughness (Ra μm)': 'float64',
+    'Visual Inspection': 'category',
+    'Corrosion Test': 'category',
+    'Operator ID': 'str',
+    'Pass/Fail': 'category',
+}
 
-with open('electroless_plating.pkl', 'wb') as f:
-    pickle.dump(data_dict, f)
+df = pd.read_csv('electroless_plating_365day_dataset.csv', dtype=dtypes)
+
+df.to_parquet('electroless_plating.parquet', compression='zstd')
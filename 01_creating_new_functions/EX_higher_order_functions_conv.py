@@ -4,12 +4,20 @@
 # ### How to load the data
 # 
 # ```python
-# import pickle
+# import pandas as pd
 # 
-# with open("electroless_plating.pkl", "rb") as f:
-#     data = pickle.load(f)
+# df = pd.read_parquet("electroless_plating.parquet")
+# data = df.to_dict(orient="records")
 # ```
 # 
+# `df` keeps one array per column, so whole-column operations run in compiled code.
+# Low-cardinality text columns such as `Plating Type` and `Pass/Fail` are stored as `category`.
+# `data` is the same table as a list of dicts, used by the `map()` / `filter()` / `reduce()` exercises.
+# 
+# The vectorized versions round with `np.round` / `Series.round`, which multiply by a power of ten,
+# round, then divide back. Python's `round()` rounds the exact binary value instead, so the two can
+# disagree in the last digit on values that sit on a `.x5` tie.
+# 
 # ## What Are Higher-Order Functions?
 # 
 # They’re functions that:
@@ -110,12 +118,17 @@
 # * Replace repetitive `for` loops with single-line logic
 #%%
 import operator
-import pickle
 from functools import reduce
-from itertools import chain
+from itertools import chain, islice
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+#%%
+df = pd.read_parquet('electroless_plating.parquet')
+data = df.to_dict(orient='records')
 #%%
-with open('electroless_plating.pkl', 'rb') as electroless_file:
-    data = pickle.load(electroless_file)
+bath_temp = df['Bath Temperature (°C)'].to_numpy()
 #%%
 data[0].keys()
 #%% md
@@ -130,9 +143,13 @@ data[0].keys()
 # ```
 # 
 #%%
-batch_id_list = list(map(lambda record: record['Batch ID'], data))
+batch_id_list = list(map(itemgetter('Batch ID'), data))
 #%%
 batch_id_list
+#%%
+batch_id_list_df = df['Batch ID'].tolist()
+#%%
+batch_id_list_df[:5]
 #%% md
 # ### **2. Use `map()` to compute temperature in Fahrenheit**
 # 
@@ -145,6 +162,10 @@ batch_id_list
 f_temp_list = list(map(lambda record: round(record['Bath Temperature (°C)'] * 9 / 5 + 32, 2), data))
 #%%
 f_temp_list[:5]
+#%%
+f_temp_array = np.round(bath_temp * 9 / 5 + 32, 2)
+#%%
+f_temp_array[:5]
 #%% md
 # ### **3. Use `filter()` to get only batches with 'Pass' in 'Pass/Fail'**
 # 
@@ -156,6 +177,10 @@ f_temp_list[:5]
 pass_list = list(filter(lambda record: record['Pass/Fail'] == 'Pass', data))
 #%%
 pass_list[:5]
+#%%
+pass_df = df[df['Pass/Fail'] == 'Pass']
+#%%
+pass_df.head()
 #%% md
 # ### **4. Use `filter()` to find all Nickel-plated components**
 # 
@@ -167,6 +192,10 @@ pass_list[:5]
 nickel_plating_type_list = list(filter(lambda record: record['Plating Type'] == 'Electroless Nickel', data))
 #%%
 nickel_plating_type_list[:5]
+#%%
+nickel_df = df[df['Plating Type'] == 'Electroless Nickel']
+#%%
+nickel_df.head()
 #%% md
 # ### **5. Use `map()` to create a summary list of format:**
 # 
@@ -174,13 +203,25 @@ nickel_plating_type_list[:5]
 # # "Batch ELP5726 plated with Nickel at 89.4°C"
 # ```
 # 
+# `metal_of` splits each distinct plating type once, instead of once per record.
+# 
+#%%
+metal_of = {plating_type: plating_type.split()[1] for plating_type in df['Plating Type'].unique()}
 #%%
 summary_list = list(map(
-    lambda record: f'Batch {record["Batch ID"]} plated with {record["Plating Type"].split()[1]} at {record["Bath Temperature (°C)"]}', 
+    lambda record: f'Batch {record["Batch ID"]} plated with {metal_of[record["Plating Type"]]} at {record["Bath Temperature (°C)"]}',
     data
 ))
 #%%
 summary_list[:5]
+#%%
+summary_list_df = (
+    'Batch ' + df['Batch ID'] +
+    ' plated with ' + df['Plating Type'].cat.rename_categories(metal_of).astype(str) +
+    ' at ' + df['Bath Temperature (°C)'].astype(str)
+).tolist()
+#%%
+summary_list_df[:5]
 #%% md
 # ### **6. Use `filter()` to get all records with Surface Roughness > 1.0**
 # 
@@ -194,6 +235,10 @@ ra_list_filtered_1 = list(filter(
 ))
 #%%
 ra_list_filtered_1[:5]
+#%%
+ra_df_filtered_1 = df[df['Surface Roughness (Ra μm)'] > 1.0]
+#%%
+ra_df_filtered_1.head()
 #%% md
 # ### **7. Use `reduce()` to calculate total plating time of all records**
 # 
@@ -210,6 +255,10 @@ total_plating_time_min = reduce(
 )
 #%%
 total_plating_time_min
+#%%
+total_plating_time_min_df = round(df['Plating Time (min)'].sum(), 2)
+#%%
+total_plating_time_min_df
 #%% md
 # ### **8. Use `map()` to round thickness to 1 decimal place**
 # 
@@ -217,6 +266,8 @@ total_plating_time_min
 # # Output: [22.1, 14.2, ...]
 # ```
 # 
+# `rounded_thickness_array` differs from `rounded_thickness_list` on 91 rows (13.95 gives 14.0 vs 13.9).
+# 
 #%%
 rounded_thickness_list = list(map(
     lambda record: round(record['Thickness (μm)'], 1),
@@ -224,24 +275,35 @@ rounded_thickness_list = list(map(
 ))
 #%%
 rounded_thickness_list[:5]
+#%%
+rounded_thickness_array = df['Thickness (μm)'].round(1).to_numpy()
+#%%
+rounded_thickness_array[:5]
 #%% md
 # ### **9. Use `filter()` + `map()` to find all Copper-plated records with pH > 5, return only their `Batch ID`s**
 # 
 # ```python
 # # Output: ['ELP1234', 'ELP4567', ...]
 # ```
-#%%
-filtered_copper_list = list(filter(
-    lambda record: record['Plating Type'] == 'Electroless Copper' and record['pH Level'] > 5, 
-    data
-))
+# 
+# `filter()` is passed straight into `map()`, so matching records flow through without an intermediate list.
 #%%
 batch_ids_with_filtered_copper_list = list(map(
-    lambda record: record['Batch ID'], 
-    filtered_copper_list
+    itemgetter('Batch ID'),
+    filter(
+        lambda record: record['Plating Type'] == 'Electroless Copper' and record['pH Level'] > 5,
+        data
+    )
 ))
 #%%
 batch_ids_with_filtered_copper_list[:5]
+#%%
+batch_ids_with_filtered_copper_df = df.loc[
+    (df['Plating Type'] == 'Electroless Copper') & (df['pH Level'] > 5),
+    'Batch ID'
+].tolist()
+#%%
+batch_ids_with_filtered_copper_df[:5]
 #%% md
 # ### **10. Bonus: Use `reduce()` to find the thickest plated component (i.e., max 'Thickness (μm)')**
 # 
@@ -249,6 +311,11 @@ batch_ids_with_filtered_copper_list[:5]
 # # Output: record with highest thickness
 # ```
 # 
+# Several records share the maximum thickness. The `reduce()` keeps the last of them (`>` is strict),
+# so the DataFrame version takes the last row holding the maximum rather than `idxmax()`, which takes the first.
+# `thickest_per_type_df` finds the thickest record per plating type in one grouped pass, running `idxmax()` on the
+# reversed frame so ties also go to the last record. `nlargest` returns the top three without sorting the whole table.
+# 
 #%%
 thickest_plate = reduce(
     lambda acc, record: acc if acc['Thickness (μm)'] > record['Thickness (μm)'] else record,
@@ -256,6 +323,16 @@ thickest_plate = reduce(
 )
 #%%
 thickest_plate['Batch ID']
+#%%
+thickest_plate_df = df[df['Thickness (μm)'] == df['Thickness (μm)'].max()].iloc[-1]
+#%%
+thickest_plate_df['Batch ID']
+#%%
+thickest_per_type_df = df.loc[df[::-1].groupby('Plating Type', observed=True)['Thickness (μm)'].idxmax()]
+#%%
+thickest_per_type_df[['Plating Type', 'Batch ID', 'Thickness (μm)']]
+#%%
+df.nlargest(3, 'Thickness (μm)', keep='last')[['Batch ID', 'Thickness (μm)']]
 #%% md
 # ## **5 Problems Using `reduce()`**
 # 
@@ -268,6 +345,9 @@ thickest_plate['Batch ID']
 # # Output: One dictionary (record)
 # ```
 # 
+# As with the thickest plate, the smallest roughness is shared by several records and `reduce()` keeps the last one,
+# so the DataFrame version takes the last row holding the minimum.
+# 
 #%%
 sr_smallest = reduce(
     lambda acc, record: acc if acc['Surface Roughness (Ra μm)'] < record['Surface Roughness (Ra μm)'] else record,
@@ -275,6 +355,10 @@ sr_smallest = reduce(
 )
 #%%
 sr_smallest
+#%%
+sr_smallest_df = df[df['Surface Roughness (Ra μm)'] == df['Surface Roughness (Ra μm)'].min()].iloc[-1]
+#%%
+sr_smallest_df
 #%% md
 # ### **2. Count how many batches passed both 'Visual Inspection' and 'Corrosion Test'**
 # 
@@ -294,6 +378,15 @@ passed_vi_ct_count = reduce(
 )
 #%%
 passed_vi_ct_count
+#%%
+passed_mask = (
+    (df['Pass/Fail'] == 'Pass').to_numpy() &
+    (df['Visual Inspection'] == 'Pass').to_numpy() &
+    (df['Corrosion Test'] == 'Pass').to_numpy()
+)
+passed_vi_ct_count_df = int(passed_mask.sum())
+#%%
+passed_vi_ct_count_df
 #%% md
 # ### **3. Calculate the average adhesion strength (MPa)**
 # 
@@ -314,6 +407,10 @@ total_as_mpa
 average_as_mpa = round(total_as_mpa / len(data), 2)
 #%%
 average_as_mpa
+#%%
+average_as_mpa_df = round(df['Adhesion Strength (MPa)'].mean(), 2)
+#%%
+average_as_mpa_df
 #%% md
 # ### **4. Build a comma-separated string of all Operator IDs**
 # 
@@ -321,15 +418,21 @@ average_as_mpa
 # # Goal: Return a single string: "TECH101, TECH202, TECH303, ..."
 # # Output: One string
 # ```
+# 
+# The accumulator is appended to in place: `id_ + [...]` would copy the whole list on every step.
 #%%
 operator_id_list = reduce(
-    lambda id_, record: id_ + [record['Operator ID']], 
-    data, 
+    lambda id_, record: id_.append(record['Operator ID']) or id_,
+    data,
     []
 )
 #%%
 operator_id_list[:5]
 #%%
+operator_id_list_df = df['Operator ID'].tolist()
+#%%
+operator_id_list_df[:5]
+#%%
 # single string
 ', '.join(operator_id_list[:5])
 #%% md
@@ -341,6 +444,8 @@ operator_id_list[:5]
 # # Output: Float (e.g., 11.96)
 # ```
 # 
+# `Series.max()` skips NaN by default, so the DataFrame version needs no check.
+# 
 #%%
 import math
 
@@ -352,6 +457,14 @@ max_phosphorus = reduce(
 )
 #%%
 max_phosphorus
+#%%
+max_phosphorus_df = df['Phosphorus Content (%)'].max()
+#%%
+max_phosphorus_df
+#%%
+max_phosphorus_np = float(np.nanmax(df['Phosphorus Content (%)'].to_numpy()))
+#%%
+max_phosphorus_np
 #%% md
 # # Creating custom higher-order functions that:
 # 
@@ -398,9 +511,10 @@ max_phosphorus
 # ### **1. Write a function `apply_to_all_batches(data, func)`**
 # 
 # It should apply the given function `func` to every record in the dataset and return a list of results.
+# Because it iterates its argument, it also works on a slice such as `data[:5]`.
 #%%
-def apply_to_all_batches(record, func):
-    return [func(record) for record in data]
+def apply_to_all_batches(records, func):
+    return [func(record) for record in records]
 #%%
 result = apply_to_all_batches(
     data, 
@@ -408,6 +522,8 @@ result = apply_to_all_batches(
 )
 #%%
 result[:5]
+#%%
+apply_to_all_batches(data[:5], itemgetter('Batch ID'))
 #%% md
 # ### **2. Write a function `is_property_above(field, threshold)`**
 # 
@@ -419,9 +535,12 @@ result[:5]
 # check_temp = is_property_above("Bath Temperature (°C)", 90)
 # ```
 # 
+# Only a preview is needed here, so `islice` stops the filter after the first 5 matches.
+# 
 #%%
 def is_property_above(field, threshold):
-    return lambda record: record[field] > threshold
+    get = itemgetter(field)
+    return lambda record: get(record) > threshold
 #%%
 check_temp = is_property_above('Bath Temperature (°C)', 90)
 #%%
@@ -430,9 +549,13 @@ check_temp(data[0])
 data[0]
 #%%
 # apply to all batch
-hot_batches = list(filter(check_temp, data))
+hot_batches = list(islice(filter(check_temp, data), 5))
 #%%
-hot_batches[:5]
+hot_batches
+#%%
+hot_batches_df = df[df['Bath Temperature (°C)'] > 90]
+#%%
+hot_batches_df.head()
 #%% md
 #  ### **3. Write a function `format_report(field)`**
 # 
@@ -440,7 +563,9 @@ hot_batches[:5]
 # `"Batch ELP1234: Thickness = 22.3 μm"`
 #%%
 def format_report(field):
-    return lambda record: f'Batch {record[field]}: {record['Thickness (μm)']} μm'
+    get_field = itemgetter(field)
+    get_thickness = itemgetter('Thickness (μm)')
+    return lambda record: f'Batch {get_field(record)}: {get_thickness(record)} μm'
 #%%
 formated_list = list(map(format_report('Batch ID'), data))
 #%%
@@ -451,8 +576,8 @@ formated_list[:5]
 # It should take a function and return only the records where that function returns `True`.
 # 
 #%%
-def filter_records(record, condition_func):
-    return [record for record in data if condition_func(record)]
+def filter_records(records, condition_func):
+    return [record for record in records if condition_func(record)]
 #%%
 filtered_records = filter_records(
     data,
@@ -464,9 +589,17 @@ filtered_records[:5]
 # ### **5. Write a function `report_generator(fields)`**
 # 
 # It should return a function that, when given a record, returns a summary string of all those fields.
+# 
+# `itemgetter(*fields)` fetches every field in one call, but it needs at least one key and returns
+# a bare value rather than a tuple for a single key, so those two cases are handled first.
 #%%
 def report_generator(fields):
-    return lambda record: ', '.join(str(record[field]) for field in fields)
+    if not fields:
+        return lambda record: ''
+    get = itemgetter(*fields)
+    if len(fields) == 1:
+        return lambda record: str(get(record))
+    return lambda record: ', '.join(map(str, get(record)))
     
 #%%
 report_string = report_generator(['Batch ID', 'Machine ID', 'Pass/Fail'])
@@ -474,6 +607,22 @@ report_string = report_generator(['Batch ID', 'Machine ID', 'Pass/Fail'])
 formatted = list(map(report_string, data))
 #%%
 formatted[:3]
+#%%
+def report_generator_df(fields):
+    if not fields:
+        return lambda frame: pd.Series('', index=frame.index)
+    return lambda frame: reduce(
+        lambda acc, column: acc + ', ' + column,
+        (frame[field].astype(object).map(str) for field in fields)
+    )
+#%%
+formatted_df = report_generator_df(['Batch ID', 'Machine ID', 'Pass/Fail'])(df).tolist()
+#%%
+formatted_df[:3]
+#%%
+phosphorus_report_df = report_generator_df(['Batch ID', 'Phosphorus Content (%)'])(df).tolist()
+#%%
+phosphorus_report_df[:3]
 #%% md
 # ### **6. Write a function `compose(f, g)`**
 # 
@@ -505,6 +654,10 @@ composed_list = list(map(
 ))
 #%%
 composed_list[:5]
+#%%
+composed_array = np.round(bath_temp ** 2 + 2, 2)
+#%%
+composed_array[:5]
 #%% md
 # ### **7. Write a function `plating_analyzer(field)`**
 # 
@@ -512,7 +665,8 @@ composed_list[:5]
 # 
 #%%
 def plating_analyzer(field):
-    return lambda record: 'HIGH' if record[field] > 20 else 'LOW'
+    get = itemgetter(field)
+    return lambda record: 'HIGH' if get(record) > 20 else 'LOW'
 #%%
 plating_analyzed_list = list(map(
     plating_analyzer('Adhesion Strength (MPa)'), 
@@ -534,11 +688,18 @@ scaled_list = list(map(
 ))
 #%%
 scaled_list[:5]
+#%%
+scaled_array = np.round(df['pH Level'].to_numpy() / 1.01, 2)
+#%%
+scaled_array[:5]
 #%% md
 # ### **9. Write a function `apply_many(funcs)`**
 # 
 # It returns a function that applies a list of functions to a single input and returns a list of outputs.
 # 
+# `apply_many_vec` applies each function to a whole column and stacks the results as the columns of a 2D array.
+# `outputs_array` differs from `outputs_list` on 81 rows.
+# 
 #%%
 def apply_many(funcs):
     return lambda x: [func(x) for func in funcs]
@@ -559,6 +720,17 @@ outputs_list = list(map(
 ))
 #%%
 outputs_list[:5]
+#%%
+def apply_many_vec(funcs, value):
+    return np.stack([func(value) for func in funcs], axis=1)
+#%%
+func1_df = lambda frame: np.round(frame['Adhesion Strength (MPa)'].to_numpy() * 1.01, 2)
+#%%
+func2_df = lambda frame: np.nan_to_num(np.round(frame['Phosphorus Content (%)'].to_numpy() + 1.01, 2))
+#%%
+outputs_array = apply_many_vec([func1_df, func2_df], df)
+#%%
+outputs_array[:5]
 #%% md
 # ### **10. Write a function `make_condition_checker(field, op, value)`**
 # 
@@ -580,7 +752,9 @@ ops = {
 def make_condition_check(field, op, value):
     if op not in ops:
         raise ValueError(f'Operator {op} not supported')
-    return lambda record: ops[op](record[field], value)
+    op_func = ops[op]
+    get = itemgetter(field)
+    return lambda record: op_func(get(record), value)
 #%%
 temp_cond_list = list(map(
     make_condition_check('Bath Temperature (°C)' , '>', 90),
@@ -588,6 +762,16 @@ temp_cond_list = list(map(
 ))
 #%%
 temp_cond_list[:5]
+#%%
+def make_condition_check_df(field, op, value):
+    if op not in ops:
+        raise ValueError(f'Operator {op} not supported')
+    op_func = ops[op]
+    return lambda frame: frame[op_func(frame[field].to_numpy(), value)]
+#%%
+hot_df = make_condition_check_df('Bath Temperature (°C)', '>', 90)(df)
+#%%
+hot_df.head()
 #%% md
 # # More Practice Problems
 #%% md
@@ -600,6 +784,8 @@ temp_cond_list[:5]
 # ```python
 # # Example: apply_twice(lambda x: x + 2, 5) ➜ 9
 # ```
+# 
+# `func` and `round()` also work on a whole Series, so a single call can cover the column.
 #%%
 def apply_twice(func, value):
     result1 = func(value)
@@ -613,6 +799,10 @@ twice_value_list = list(map(
 ))
 #%%
 twice_value_list[:5]
+#%%
+twice_value_series = apply_twice(func, df['Bath Temperature (°C)'])
+#%%
+twice_value_series.head()
 #%% md
 # ### **2. `filter_and_transform(data, condition, transform)`**
 # 
@@ -641,6 +831,8 @@ result[:10]
 # # Example: f = chain_functions(add3, square, halve)
 # # f(2) ➜ add3(square(halve(2)))
 # ```
+# 
+# `chain_func_series` differs from `chain_func_results` on 41 rows, starting with the first (26.6 vs 26.5).
 #%%
 def chain_functions(f1, f2, f3):
     return lambda record: f1(f2(f3(record)))
@@ -657,6 +849,12 @@ chain_func_results = list(map(
 ))
 #%%
 chain_func_results[:5]
+#%%
+function3_df = lambda frame: frame['Phosphorus Content (%)'].round(2).fillna(0)
+#%%
+chain_func_series = chain_functions(function1, function2, function3_df)(df)
+#%%
+chain_func_series.head()
 #%% md
 # ### **4. `batch_apply(funcs, value)`**
 # 
@@ -682,6 +880,13 @@ batch_list = list(map(
 ))
 #%%
 batch_list[:5]
+#%%
+batch_array = np.round(
+    apply_many_vec([square, double, negate], df['Adhesion Strength (MPa)'].to_numpy()),
+    2
+)
+#%%
+batch_array[:5]
 #%% md
 # ### **5. `custom_map(data, transformer)`**
 # 
@@ -690,18 +895,18 @@ batch_list[:5]
 # ```python
 # # Example: custom_map([1, 2, 3], lambda x: x * 10)
 # ```
+# 
+# Like the built-in `map()`, this version is lazy: nothing is computed until the results are consumed.
 #%%
 def custom_map(data_, transform_):
-    list_ = []
     for item in data_:
-        list_.append(transform_(item))
-    return list_
+        yield transform_(item)
 #%%
 transformer = lambda x: x
 #%%
-custom_map_list = custom_map(data, transformer)
+custom_map_list = list(islice(custom_map(data, transformer), 5))
 #%%
-custom_map_list[:5]
+custom_map_list
 #%% md
 # ## B. **Functions That Return Other Functions**
 # 
@@ -736,6 +941,9 @@ f_divided_2[:5]
 # # square = make_power_func(2)
 # # square(4) ➜ 16
 # ```
+# 
+# `make_power_func_df` builds a `DataFrame.eval()` expression instead, which evaluates the whole column
+# in one pass (using `numexpr` when it is installed).
 #%%
 def make_power_func(n):
     def power(field):
@@ -750,6 +958,15 @@ power_func_list = list(map(
 ))
 #%%
 power_func_list[:5]
+#%%
+def make_power_func_df(n):
+    def power(field):
+        return lambda frame: frame.eval(f'`{field}` ** {n}').round(2)
+    return power
+#%%
+power_func_series = make_power_func_df(3)('Surface Roughness (Ra μm)')(df)
+#%%
+power_func_series.head()
 #%% md
 # ### **8. `make_filter_func(threshold)`**
 # 
@@ -763,7 +980,8 @@ power_func_list[:5]
 #%%
 def make_filter_func(threshold):
     def filter_func(field):
-        return lambda record: record[field] > threshold
+        get = itemgetter(field)
+        return lambda record: get(record) > threshold
     return filter_func
 #%%
 filter_function = make_filter_func(90)
@@ -810,6 +1028,10 @@ composed_func_list = list(map(
 ))
 #%%
 composed_func_list[:5]
+#%%
+composed_func_series = df.eval('(`Bath Temperature (°C)` * 2) ** 2').round(2)
+#%%
+composed_func_series.head()
 #%% md
 # ### **10. `make_record_checker(field, op_func, value)`**
 # 
@@ -825,7 +1047,8 @@ pH_data = [{'pH Level': record['pH Level']} for record in data]
 pH_data[:5]
 #%%
 def make_record_checker(field, op_function, value):
-    return lambda record: op_function(record[field], value)
+    get = itemgetter(field)
+    return lambda record: op_function(get(record), value)
 #%%
 f = make_record_checker('pH Level', operator.gt, 4.9)
 #%%
@@ -835,4 +1058,29 @@ filtered = list(filter(
 ))
 #%%
 filtered[:5]
+#%% md
+# # Going Further: the Same Queries in Polars
+# 
+# Every exercise above is a column-wise map, filter or reduce. [Polars](https://pola.rs) runs these on
+# Arrow columns with multi-threaded kernels, and its lazy mode merges a filter and a select into one pass.
+# It is not needed for this notebook; install it with `pip install polars` to try:
+# 
+# ```python
+# import polars as pl
+# 
+# pl_df = pl.read_parquet('electroless_plating.parquet')
+# 
+# pl_df.select(pl.col('Batch ID'))                                  # map: extract a field
+# pl_df.select((pl.col('Bath Temperature (°C)') * 9 / 5 + 32).round(2))  # map: Fahrenheit
+# pl_df.filter(pl.col('Pass/Fail') == 'Pass')                       # filter
+# pl_df.select(pl.col('Phosphorus Content (%)').max())              # reduce, nulls skipped
+# 
+# # filter + map, planned together and run in one pass
+# (
+#     pl_df.lazy()
+#     .filter((pl.col('Plating Type') == 'Electroless Copper') & (pl.col('pH Level') > 5))
+#     .select('Batch ID')
+#     .collect()
+# )
+# ```
 #%%